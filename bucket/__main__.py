@@ -146,7 +146,15 @@ def write(ctx, readout_specs: Iterable[str], merge: bool):
     readouts = get_readouts_from_spec(*readout_specs)
 
     if merge:
-        readouts = [MergeReadout(*readouts)]
+        # Fold readouts in one at a time, so each source can be released once
+        # merged rather than all being held until the merge starts
+        readouts = iter(readouts)
+        if (first_readout := next(readouts, None)) is None:
+            raise ValueError("No readouts to merge")
+        merged_readout = MergeReadout(first_readout)
+        for readout in readouts:
+            merged_readout.merge(readout)
+        readouts = [merged_readout]
 
     ctx.obj["readouts"] = readouts
 
@@ -177,12 +185,19 @@ def json(ctx, output: Path):
     required=True,
     type=click.Path(path_type=Path),
 )
-def archive(ctx, output: Path):
+@click.option(
+    "--compress-level",
+    "compresslevel",
+    default=9,
+    type=click.IntRange(0, 9),
+    help="gzip compression level; 1 is fastest, 9 is smallest",
+)
+def archive(ctx, output: Path, compresslevel: int):
     readouts = ctx.obj["readouts"]
-    writer = ArchiveAccessor(output).writer()
+    writer = ArchiveAccessor(output).writer(compresslevel)
 
-    for readout in readouts:
-        writer.write(readout)
+    # Write all readouts with a single unpack/repack of the archive
+    writer.write_all(readouts)
 
 
 @write.command()
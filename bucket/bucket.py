@@ -76,13 +76,45 @@ class Bucket:
         if bucket_goal.target != 0:
             parent._cvg_hits[axis_value_tuple] += 1
         if bucket_goal.target < 0:
-            illegal_str = (
-                f"Illegal bucket '{parent._name}.{bucket_goal.name}' hit! "
-                + f"Bucket values: {dict(zip(parent._axis_names, list(axis_value_tuple), strict=True))}"
-            )
-            if parent._config.except_on_illegal:
-                raise RuntimeError(illegal_str)
-            self.log.error(illegal_str)
+            self._illegal_hit(bucket_goal, axis_value_tuple)
+
+    def hit_values(self, *values):
+        """
+        Increment the hit count for the bucket given by the axis values passed in,
+        in the order the axes were added to the coverpoint. Values set with
+        set_axes() are not used or changed. This avoids naming each axis on every
+        hit, for coverpoints which sample many times.
+        """
+        parent = self.parent
+        assert (
+            len(values) == parent._axis_count
+        ), "Incorrect number of axes have been set"
+
+        axis_value_tuple = tuple(
+            [
+                axis_resolver(value)
+                for (_, axis_resolver), value in zip(parent._axis_resolvers, values)
+            ]
+        )
+        # Goal lookup and hit increment inlined as in hit()
+        bucket_goal = parent._cvg_goals.get(axis_value_tuple, parent._default_goal)
+        if bucket_goal.target != 0:
+            parent._cvg_hits[axis_value_tuple] += 1
+        if bucket_goal.target < 0:
+            self._illegal_hit(bucket_goal, axis_value_tuple)
+
+    def _illegal_hit(self, bucket_goal, axis_value_tuple: tuple):
+        """
+        Report a hit on an ILLEGAL bucket, given its resolved axis value names
+        """
+        parent = self.parent
+        illegal_str = (
+            f"Illegal bucket '{parent._name}.{bucket_goal.name}' hit! "
+            + f"Bucket values: {dict(zip(parent._axis_names, list(axis_value_tuple), strict=True))}"
+        )
+        if parent._config.except_on_illegal:
+            raise RuntimeError(illegal_str)
+        self.log.error(illegal_str)
 
     def set_axes(self, **kwargs):
         """
@@ -16,11 +16,11 @@ from .base import CoverBase
 from .common.chain import Link, OpenLink
 from .common.types import MatchStrs, TagStrs
 from .context import CoverageContext
+from .coverpoint import Coverpoint
 from .link import CovDef, CovRun
 
 if TYPE_CHECKING:
     from .covergroup import Covergroup
-    from .coverpoint import Coverpoint
     from .covertop import CoverConfig
 
 
@@ -63,6 +63,7 @@ class Covergroup(CoverBase):
         self._coverpoints = {}
         self._covergroups = {}
         self._ordered_children_cache: tuple[CoverBase, ...] | None = None
+        self._sampled_children_cache: tuple[CoverBase, ...] | None = None
         self._sha = hashlib.sha256((self._name + self._description).encode())
         self._setup()
 
@@ -108,6 +109,7 @@ class Covergroup(CoverBase):
             any_children_active |= child._set_tier_level(tier)
         # Empty covergroups (no children) remain inactive
         self._tier_active = any_children_active
+        self._sampled_children_cache = None
         return self._tier_active
 
     def _match_by_name(self, names: MatchStrs):
@@ -128,9 +130,6 @@ class Covergroup(CoverBase):
 
     def _match_by_tags(self, tags: TagStrs, match_all: bool = False):
         def matcher(cp: CoverBase):
-            # Import locally to avoid circular import at module level
-            from .coverpoint import Coverpoint
-
             # Only match Coverpoints, not Covergroups
             if not isinstance(cp, Coverpoint):
                 return False
@@ -161,6 +160,7 @@ class Covergroup(CoverBase):
                 )
 
         self._active = any_children_active
+        self._sampled_children_cache = None
         return self._active
 
     def add_coverpoint(
@@ -199,6 +199,7 @@ class Covergroup(CoverBase):
             raise Exception("Coverpoint names must be unique within a covergroup")
         self._coverpoints[coverpoint._name] = coverpoint
         self._ordered_children_cache = None
+        self._sampled_children_cache = None
 
     def add_covergroup(
         self,
@@ -226,6 +227,7 @@ class Covergroup(CoverBase):
             raise Exception("Covergroup names must be unique within a covergroup")
         self._covergroups[covergroup._name] = covergroup
         self._ordered_children_cache = None
+        self._sampled_children_cache = None
 
     def __getattr__(self, key: str):
         """
@@ -275,7 +277,7 @@ class Covergroup(CoverBase):
         """Call sample for all children if active"""
 
         if self._active and self.should_sample(trace):
-            for child in self.iter_children():
+            for child in self._sampled_children():
                 child._sample(trace)
 
     def iter_children(self) -> Iterable[CoverBase]:
@@ -291,6 +293,21 @@ class Covergroup(CoverBase):
             )
         yield from self._ordered_children_cache
 
+    def _sampled_children(self) -> tuple[CoverBase, ...]:
+        """
+        Children which are currently active and within the tier level, in the same
+        order as iter_children. Filtered out children are left out entirely so that
+        sampling never visits them. The cache is invalidated when children are added,
+        or filters or tier levels are applied.
+        """
+        if self._sampled_children_cache is None:
+            self._sampled_children_cache = tuple(
+                child
+                for child in self.iter_children()
+                if child._active and child._tier_active
+            )
+        return self._sampled_children_cache
+
     def _chain_def(self, start: OpenLink[CovDef] | None = None) -> Link[CovDef]:
         start = start or OpenLink(CovDef())
         child_start = start.link_down()
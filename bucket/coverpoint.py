@@ -71,6 +71,10 @@ class Coverpoint(CoverBase):
                 size=trace['Weight']
             )
 
+    Example 4 (passing axis values in the order the axes were added)::
+
+            self.bucket.hit_values(trace['Name'], trace['Age'], trace['Weight'])
+
     """
 
     def _init(
@@ -125,8 +129,12 @@ class Coverpoint(CoverBase):
             (axis.name, axis.get_named_value) for axis in self._axes
         )
         self._axis_count = len(self._axis_resolvers)
+        # Every axis value combination (i.e. bucket) in bucket order. These are
+        # walked on every readout, so build them once rather than re-running the
+        # product each time.
+        self._bucket_keys = tuple(self._all_axis_value_combinations())
         goals = SimpleNamespace(**self._goal_dict)
-        for combination in self._all_axis_value_combinations():
+        for combination in self._bucket_keys:
             # Create bucket with both name and value for each axis
             bucket_dict = {}
             for axis, value_name in zip(self._axes, combination, strict=True):
@@ -138,8 +146,13 @@ class Coverpoint(CoverBase):
             else:
                 goal = self._goal_dict["DEFAULT"]
             self._sha.update(goal.sha.digest())
+        # Goals are fixed once the coverpoint is created, so look up the target
+        # for each bucket (in bucket order) once rather than on every readout
+        self._bucket_targets = tuple(
+            self._get_goal(bucket).target for bucket in self._bucket_keys
+        )
 
-        self.debug(f"Coverpoint created: {self._name}: {self._description}")
+        self.debug("Coverpoint created: %s: %s", self._name, self._description)
 
     def _setup(self):
         """
@@ -286,19 +299,16 @@ class Coverpoint(CoverBase):
             child_close = goal.chain(child_start)
             child_start = child_close.link_across()
 
-        buckets = 0
         target = 0
         target_buckets = 0
-        for bucket in self._all_axis_value_combinations():
-            bucket_target = self._get_goal(bucket).target
+        for bucket_target in self._bucket_targets:
             if bucket_target > 0:
                 target += bucket_target
                 target_buckets += 1
-            buckets += 1
 
         link = CovDef(
             point=1,
-            bucket=buckets,
+            bucket=len(self._bucket_targets),
             target=target,
             target_buckets=target_buckets,
             sha=self._sha,
@@ -309,26 +319,21 @@ class Coverpoint(CoverBase):
     def _chain_run(self, start: OpenLink[CovRun] | None = None) -> Link[CovRun]:
         start = start or OpenLink(CovRun())
 
-        buckets = 0
         hits = 0
         hit_buckets = 0
         full_buckets = 0
-        for bucket in self._all_axis_value_combinations():
-            bucket_target = self._get_goal(bucket).target
-            bucket_hits = self._cvg_hits[bucket]
-
+        for bucket, bucket_target in zip(self._bucket_keys, self._bucket_targets):
             if bucket_target > 0:
-                bucket_hits = min(bucket_target, bucket_hits)
+                bucket_hits = min(bucket_target, self._cvg_hits[bucket])
                 if bucket_hits > 0:
                     hit_buckets += 1
                     if bucket_hits == bucket_target:
                         full_buckets += 1
                     hits += bucket_hits
-            buckets += 1
 
         link = CovRun(
             point=1,
-            bucket=buckets,
+            bucket=len(self._bucket_targets),
             hits=hits,
             hit_buckets=hit_buckets,
             full_buckets=full_buckets,
@@ -340,14 +345,14 @@ class Coverpoint(CoverBase):
         """
         Get goals for each bucket
         """
-        for bucket in self._all_axis_value_combinations():
+        for bucket in self._bucket_keys:
             yield self._get_goal(bucket).name
 
     def _bucket_hits(self):
         """
         Get hits for each bucket
         """
-        for bucket in self._all_axis_value_combinations():
+        for bucket in self._bucket_keys:
             yield self._cvg_hits[bucket]
 
     def should_sample(self, trace) -> bool:
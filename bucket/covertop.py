@@ -6,7 +6,7 @@
 
 import logging
 from dataclasses import dataclass
-from typing import Callable
+from typing import Callable, Iterable
 
 from pydantic import validate_call
 
@@ -55,9 +55,23 @@ class Covertop(Covergroup):
         """Go through the coverage tree and recursively call sample, passing in trace"""
         processed_trace = self.process_trace(trace)
         if processed_trace is not None and self.should_sample(processed_trace):
-            for child in self.iter_children():
+            for child in self._sampled_children():
                 child._sample(processed_trace)
 
+    def sample_all(self, traces: Iterable):
+        """
+        Sample each trace in turn. This is equivalent to calling sample() on each
+        trace, but the children of the top level are only looked up once.
+        """
+        children = self._sampled_children()
+        process_trace = self.process_trace
+        should_sample = self.should_sample
+        for trace in traces:
+            processed_trace = process_trace(trace)
+            if processed_trace is not None and should_sample(processed_trace):
+                for child in children:
+                    child._sample(processed_trace)
+
     def process_trace(self, trace):
         """
         This function is to modify/preprocess the trace data into
@@ -2,11 +2,22 @@
 # Copyright (c) 2023-2026 Noodle-Bytes. All Rights Reserved
 
 import csv
+import os
 import tarfile
 import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
 from typing import Iterable, NamedTuple, overload
 
+try:
+    # ISA-L is optional, but compresses and decompresses gzip several times
+    # faster than zlib and writes compatible output
+    from isal import igzip_threaded, isal_zlib
+except ImportError:
+    igzip_threaded = None
+
 from .common import (
     ARCHIVE_FORMAT_VERSION,
     LEGACY_FORMAT_VERSION,
@@ -66,6 +77,17 @@ BUCKET_GOAL_PATH = "bucket_goal"
 POINT_HIT_PATH = "point_hit"
 BUCKET_HIT_PATH = "bucket_hit"
 
+# Tables are written a row at a time, so use a larger buffer than the default
+# to cut down on the number of small writes to disk
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Threads used by ISA-L to compress an archive
+_COMPRESS_THREADS = min(4, os.cpu_count() or 1)
+
+# Number of archives unpacked ahead of the one being merged in merge_files,
+# each on its own thread. Bounded so the unpacked copies don't pile up on disk.
+_MERGE_PREFETCH = min(4, os.cpu_count() or 1)
+
 ###############################################################################
 # Accessors
 ###############################################################################
@@ -76,13 +98,12 @@ def _write(path: Path, values: Iterable[tuple]):
     Write values to a CSV file and return the byte offsets so we can seek
     later.
     """
-    with path.open("a", newline="") as f:
+    with path.open("a", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
         byte_offset = f.tell()
         csv_writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC)
-        for value in values:
-            # Convert None values to empty strings for CSV compatibility
-            csv_row = tuple("" if v is None else v for v in value)
-            csv_writer.writerow(csv_row)
+        # The csv module writes None values as empty strings itself, so rows
+        # can be written as they are without building a converted copy of each
+        csv_writer.writerows(values)
         byte_end = f.tell()
     return byte_offset, byte_end
 
@@ -127,8 +148,55 @@ def _read(
         f.seek(byte_offset)
         data = f.read(byte_end - byte_offset)
 
-    lines = data.decode("utf-8").splitlines()[line_offset:line_end]
-    yield from _parse_rows(lines)
+    # Split the raw bytes and only decode the lines in the requested slice,
+    # rather than decoding the whole block to text first.
+    lines = data.splitlines()[line_offset:line_end]
+    yield from _parse_rows(line.decode("utf-8") for line in lines)
+
+
+def _unpack(archive_path: Path, work_path: Path):
+    """
+    Extract the tables in an archive into work_path.
+    """
+    if igzip_threaded is not None:
+        # Decompress on a separate thread while tarfile consumes the stream
+        with (
+            igzip_threaded.open(archive_path, "rb", threads=1) as f,
+            tarfile.open(fileobj=f, mode="r|") as tar,
+        ):
+            tar.extractall(work_path, filter="data")
+    else:
+        with tarfile.open(archive_path, mode="r:gz") as tar:
+            tar.extractall(work_path, filter="data")
+
+
+def _pack(archive_path: Path, work_path: Path, compresslevel: int):
+    """
+    Pack the tables in work_path into an archive.
+    """
+    # The tables sit directly in the work directory, so a single scandir
+    # (sorted by name for a stable layout) finds them all
+    with os.scandir(work_path) as entries:
+        names = sorted(entry.name for entry in entries)
+
+    # ISA-L levels only go up to 3 and its level 0 still compresses, so it is
+    # only used for levels it can honour. Others go through zlib as before.
+    if igzip_threaded is not None and (
+        1 <= compresslevel <= isal_zlib.ISAL_BEST_COMPRESSION
+    ):
+        f = igzip_threaded.open(
+            archive_path,
+            "wb",
+            compresslevel=compresslevel,
+            threads=_COMPRESS_THREADS,
+        )
+        tar = tarfile.open(fileobj=f, mode="w|")
+    else:
+        f = archive_path.open("wb", buffering=_WRITE_BUFFER_SIZE)
+        tar = tarfile.open(fileobj=f, mode="w:gz", compresslevel=compresslevel)
+    with f, tar:
+        for name in names:
+            tar.add(work_path / name, arcname=name)
 
 
 class ArchiveReadout(Readout):
@@ -271,98 +339,122 @@ class ArchiveWriter(Writer):
     Write to an archive file
     """
 
-    def __init__(self, path: str | Path):
+    def __init__(self, path: str | Path, compresslevel: int = 9):
         self.path = Path(path)
+        # gzip level used when repacking the archive. Lower levels are much
+        # faster to write at the cost of a larger file.
+        self.compresslevel = compresslevel
 
     def write(self, readout: Readout):
         """
         Write a readout to the archive.
         """
+        return self.write_all([readout])[0]
+
+    def write_all(self, readouts: Iterable[Readout]) -> list[int]:
+        """
+        Write several readouts to the archive. The archive is only unpacked and
+        repacked once, rather than once per readout as repeated write() calls
+        would. Returns the record reference for each readout.
+        """
+        # Leave the archive untouched if there is nothing to write, rather than
+        # packing one with no record table
+        readouts = iter(readouts)
+        if (first_readout := next(readouts, None)) is None:
+            return []
+        readouts = chain([first_readout], readouts)
+
         with tempfile.TemporaryDirectory() as tmpdir:
             work_path = Path(tmpdir)
             self.path.parent.mkdir(parents=True, exist_ok=True)
             work_path.mkdir(parents=True, exist_ok=True)
 
             if self.path.exists():
-                with tarfile.open(self.path, mode="r:gz") as tar:
-                    tar.extractall(work_path, filter="data")
+                _unpack(self.path, work_path)
 
-            # Write tables and get byte offsets/ends
-            point_offset, point_end = _write(
-                work_path / POINT_PATH, readout.iter_points()
-            )
-            point_hit_offset, point_hit_end = _write(
-                work_path / POINT_HIT_PATH, readout.iter_point_hits()
-            )
+            record_offsets = [
+                self._write_tables(work_path, readout) for readout in readouts
+            ]
 
-            # For non-point tables, skip the first column (offset) as it can be reconstructed
-            # when reading back.
-            axis_offset, axis_end = _write(
-                work_path / AXIS_PATH, (a[1:] for a in readout.iter_axes())
-            )
-            axis_value_offset, axis_value_end = _write(
-                work_path / AXIS_VALUE_PATH,
-                (av[1:] for av in readout.iter_axis_values()),
-            )
-            goal_offset, goal_end = _write(
-                work_path / GOAL_PATH, (bg[1:] for bg in readout.iter_goals())
-            )
-            bucket_goal_offset, bucket_goal_end = _write(
-                work_path / BUCKET_GOAL_PATH,
-                (bg[1:] for bg in readout.iter_bucket_goals()),
-            )
-            bucket_hit_offset, bucket_hit_end = _write(
-                work_path / BUCKET_HIT_PATH,
-                (bh[1:] for bh in readout.iter_bucket_hits()),
-            )
-            # Store offsets in definition and record tables so we can seek later
-            definition_offset, _ = _write(
-                work_path / DEFINITION_PATH,
-                [
-                    ArchiveDefinitionTuple(
-                        readout.get_def_sha(),
-                        point_offset,
-                        point_end,
-                        axis_offset,
-                        axis_end,
-                        axis_value_offset,
-                        axis_value_end,
-                        goal_offset,
-                        goal_end,
-                        bucket_goal_offset,
-                        bucket_goal_end,
-                    )
-                ],
-            )
+            _pack(self.path, work_path, self.compresslevel)
 
-            # source and source_key are always strings (empty string if not set)
-            source = readout.get_source()
-            source_key = readout.get_source_key()
-            bucket_version = readout.get_bucket_version()
-            record_offset, _ = _write(
-                work_path / RECORD_PATH,
-                [
-                    ArchiveRecordTuple(
-                        readout.get_rec_sha(),
-                        definition_offset,
-                        point_hit_offset,
-                        point_hit_end,
-                        bucket_hit_offset,
-                        bucket_hit_end,
-                        source,
-                        source_key,
-                        bucket_version,
-                        # Always stamp the writer's own format, not the
-                        # readout's: it describes how these bytes are laid
-                        # out, not where the data came from.
-                        ARCHIVE_FORMAT_VERSION,
-                    )
-                ],
-            )
+        return record_offsets
 
-            with tarfile.open(self.path, mode="w:gz") as tar:
-                for entry in sorted(work_path.rglob("*"), key=lambda p: p.as_posix()):
-                    tar.add(entry, arcname=entry.relative_to(work_path))
+    @staticmethod
+    def _write_tables(work_path: Path, readout: Readout) -> int:
+        """
+        Append a readout to the unpacked archive tables in work_path.
+        """
+        # Write tables and get byte offsets/ends
+        point_offset, point_end = _write(work_path / POINT_PATH, readout.iter_points())
+        point_hit_offset, point_hit_end = _write(
+            work_path / POINT_HIT_PATH, readout.iter_point_hits()
+        )
+
+        # For non-point tables, skip the first column (offset) as it can be reconstructed
+        # when reading back.
+        axis_offset, axis_end = _write(
+            work_path / AXIS_PATH, (a[1:] for a in readout.iter_axes())
+        )
+        axis_value_offset, axis_value_end = _write(
+            work_path / AXIS_VALUE_PATH,
+            (av[1:] for av in readout.iter_axis_values()),
+        )
+        goal_offset, goal_end = _write(
+            work_path / GOAL_PATH, (bg[1:] for bg in readout.iter_goals())
+        )
+        bucket_goal_offset, bucket_goal_end = _write(
+            work_path / BUCKET_GOAL_PATH,
+            (bg[1:] for bg in readout.iter_bucket_goals()),
+        )
+        bucket_hit_offset, bucket_hit_end = _write(
+            work_path / BUCKET_HIT_PATH,
+            (bh[1:] for bh in readout.iter_bucket_hits()),
+        )
+        # Store offsets in definition and record tables so we can seek later
+        definition_offset, _ = _write(
+            work_path / DEFINITION_PATH,
+            [
+                ArchiveDefinitionTuple(
+                    readout.get_def_sha(),
+                    point_offset,
+                    point_end,
+                    axis_offset,
+                    axis_end,
+                    axis_value_offset,
+                    axis_value_end,
+                    goal_offset,
+                    goal_end,
+                    bucket_goal_offset,
+                    bucket_goal_end,
+                )
+            ],
+        )
+
+        # source and source_key are always strings (empty string if not set)
+        source = readout.get_source()
+        source_key = readout.get_source_key()
+        bucket_version = readout.get_bucket_version()
+        record_offset, _ = _write(
+            work_path / RECORD_PATH,
+            [
+                ArchiveRecordTuple(
+                    readout.get_rec_sha(),
+                    definition_offset,
+                    point_hit_offset,
+                    point_hit_end,
+                    bucket_hit_offset,
+                    bucket_hit_end,
+                    source,
+                    source_key,
+                    bucket_version,
+                    # Always stamp the writer's own format, not the
+                    # readout's: it describes how these bytes are laid
+                    # out, not where the data came from.
+                    ARCHIVE_FORMAT_VERSION,
+                )
+            ],
+        )
 
         return record_offset
 
@@ -381,8 +473,7 @@ class ArchiveReader(Reader):
 
         tempdir = tempfile.TemporaryDirectory()
         path = Path(tempdir.name)
-        with tarfile.open(self.path, mode="r:gz") as tar:
-            tar.extractall(path, filter="data")
+        _unpack(self.path, path)
         return path, tempdir
 
     def read(self, rec_ref: int):
@@ -396,7 +487,15 @@ class ArchiveReader(Reader):
         """
         Read all records in the archive.
         """
-        path, tempdir = self._extract()
+        return self._read_all(*self._extract())
+
+    @staticmethod
+    def _read_all(
+        path: Path, tempdir: tempfile.TemporaryDirectory
+    ) -> Iterable[Readout]:
+        """
+        Read all records from an already extracted archive.
+        """
         # Record ids in the record file are start byte of each line
         with (path / RECORD_PATH).open("r", newline="") as f:
             while True:
@@ -417,8 +516,8 @@ class ArchiveAccessor(Accessor):
     def reader(self):
         return ArchiveReader(self.path)
 
-    def writer(self):
-        return ArchiveWriter(self.path)
+    def writer(self, compresslevel: int = 9):
+        return ArchiveWriter(self.path, compresslevel)
 
     @overload
     @classmethod
@@ -431,12 +530,27 @@ class ArchiveAccessor(Accessor):
         if len(archive_paths) == 1 and not isinstance(archive_paths[0], (str, Path)):
             archive_paths = archive_paths[0]
         merged_readout = None
-        for archive_path in archive_paths:
-            archive_accessor = cls(archive_path)
-            readout_iter = iter(archive_accessor.reader().read_all())
-            if merged_readout is None:
-                if (first_readout := next(readout_iter, None)) is None:
-                    continue
-                merged_readout = MergeReadout(first_readout)
-            merged_readout.merge(*readout_iter)
+        # Unpacking an archive is mostly gzip decompression, which releases the
+        # GIL, so the next few archives are extracted in parallel in the
+        # background while the current one is merged. They are still merged in
+        # order so the first archive's readout always leads the merge.
+        archive_paths = iter(archive_paths)
+        with ThreadPoolExecutor(max_workers=_MERGE_PREFETCH) as executor:
+            pending = deque(
+                executor.submit(cls(archive_path).reader()._extract)
+                for archive_path in islice(archive_paths, _MERGE_PREFETCH)
+            )
+            while pending:
+                path, tempdir = pending.popleft().result()
+                for archive_path in islice(archive_paths, 1):
+                    pending.append(executor.submit(cls(archive_path).reader()._extract))
+                readout_iter = iter(ArchiveReader._read_all(path, tempdir))
+                if merged_readout is None:
+                    if (first_readout := next(readout_iter, None)) is None:
+                        continue
+                    merged_readout = MergeReadout(first_readout)
+                # Fold each readout in as it is read rather than unpacking
+                # them all into arguments at once
+                for readout in readout_iter:
+                    merged_readout.merge(readout)
         return merged_readout
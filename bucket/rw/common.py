@@ -6,6 +6,7 @@ import warnings
 from datetime import datetime
 from importlib.metadata import PackageNotFoundError as _PKGNotFound
 from importlib.metadata import version as _pkg_version
+from operator import add
 from typing import Any, Iterable, NamedTuple, Protocol
 
 from ..common.chain import Link
@@ -794,9 +795,9 @@ class MergeReadout(Readout):
         self.source_key = ""
         self._bucket_version = _get_bucket_version()
 
-        self.bucket_hits: list[int] = []
-        for bucket_hit in master.iter_bucket_hits():
-            self.bucket_hits.append(bucket_hit.hits)
+        self.bucket_hits: list[int] = [
+            bucket_hit.hits for bucket_hit in master.iter_bucket_hits()
+        ]
 
         goal_targets: list[int] = []
         for goal in master.iter_goals():
@@ -809,6 +810,16 @@ class MergeReadout(Readout):
         if others:
             self.merge(*others)
 
+    @classmethod
+    def empty(cls, master: Readout) -> "MergeReadout":
+        """
+        Create a merge with the definition of master but no hits. Hits are then
+        added with merge() or merge_bucket_hits(), including those of master.
+        """
+        merged_readout = cls(master)
+        merged_readout.bucket_hits = [0] * len(merged_readout.bucket_hits)
+        return merged_readout
+
     def get_def_sha(self) -> str:
         return self.master.get_def_sha()
 
@@ -859,47 +870,89 @@ class MergeReadout(Readout):
     def iter_point_hits(
         self, start: int = 0, end: int | None = None, depth: int = 0
     ) -> Iterable[PointHitTuple]:
-        for point in self.iter_points(start, end, depth):
-            hits = 0
-            hit_buckets = 0
-            full_buckets = 0
-            for bucket_hit in self.iter_bucket_hits(
-                point.bucket_start, point.bucket_end
-            ):
-                target = self.bucket_targets[bucket_hit.start]
-                if target > 0:
-                    bucket_hits = min(bucket_hit.hits, target)
-                    if bucket_hit.hits > 0:
-                        hit_buckets += 1
-                        if bucket_hits == target:
-                            full_buckets += 1
-                        hits += bucket_hits
-
+        points = list(self.iter_points(start, end, depth))
+        if not points:
+            return
+
+        # Walk the buckets covered by the requested points once, keeping running
+        # totals. Each point's counts are then the difference of the totals at
+        # either end of its bucket range, so nested points (which share buckets
+        # with their parents) don't walk the same buckets again.
+        bucket_offset = min(point.bucket_start for point in points)
+        bucket_end = max(point.bucket_end for point in points)
+        bucket_slice = slice(bucket_offset, bucket_end)
+
+        total_hits = [0]
+        total_hit_buckets = [0]
+        total_full_buckets = [0]
+        hits = hit_buckets = full_buckets = 0
+        for bucket_hits, target in zip(
+            self.bucket_hits[bucket_slice], self.bucket_targets[bucket_slice]
+        ):
+            if target > 0 and bucket_hits > 0:
+                hit_buckets += 1
+                if bucket_hits >= target:
+                    full_buckets += 1
+                    hits += target
+                else:
+                    hits += bucket_hits
+            total_hits.append(hits)
+            total_hit_buckets.append(hit_buckets)
+            total_full_buckets.append(full_buckets)
+
+        for point in points:
+            lo = point.bucket_start - bucket_offset
+            hi = point.bucket_end - bucket_offset
             yield PointHitTuple(
                 start=point.start,
                 depth=point.depth,
-                hits=hits,
-                hit_buckets=hit_buckets,
-                full_buckets=full_buckets,
+                hits=total_hits[hi] - total_hits[lo],
+                hit_buckets=total_hit_buckets[hi] - total_hit_buckets[lo],
+                full_buckets=total_full_buckets[hi] - total_full_buckets[lo],
             )
 
     def merge(self, *readouts: Readout):
         """
         Merge additional readouts post init
         """
-        master_def_sha = self.get_def_sha()
-        master_rec_sha = self.get_rec_sha()
-
         for readout in readouts:
-            if readout.get_def_sha() != master_def_sha:
-                raise RuntimeError(
-                    "Tried to merge coverage with two different definition hashes!"
+            if isinstance(readout, MergeReadout):
+                self._check_mergeable(readout.get_def_sha(), readout.get_rec_sha())
+                # Both sides are already flat hit lists, so add them column-wise
+                self.bucket_hits[:] = map(add, self.bucket_hits, readout.bucket_hits)
+            else:
+                self.merge_bucket_hits(
+                    readout.iter_bucket_hits(),
+                    [(readout.get_def_sha(), readout.get_rec_sha())],
                 )
 
-            if readout.get_rec_sha() != master_rec_sha:
-                raise RuntimeError(
-                    "Tried to merge coverage with two different record hashes!"
-                )
+    def merge_bucket_hits(
+        self,
+        bucket_hits: Iterable[tuple[int, int]],
+        shas: Iterable[tuple[str, str]],
+    ):
+        """
+        Merge raw (start, hits) bucket hit rows, taken from records with the given
+        (def_sha, rec_sha) hashes. Accessors use this to merge stored rows without
+        first building a readout for each record.
+        """
+        for def_sha, rec_sha in shas:
+            self._check_mergeable(def_sha, rec_sha)
 
-            for bucket_hit in readout.iter_bucket_hits():
-                self.bucket_hits[bucket_hit.start] += bucket_hit.hits
+        merged_hits = self.bucket_hits
+        for start, hits in bucket_hits:
+            merged_hits[start] += hits
+
+    def _check_mergeable(self, def_sha: str, rec_sha: str):
+        """
+        Check a record with the given hashes can be merged into this readout
+        """
+        if def_sha != self.get_def_sha():
+            raise RuntimeError(
+                "Tried to merge coverage with two different definition hashes!"
+            )
+
+        if rec_sha != self.get_rec_sha():
+            raise RuntimeError(
+                "Tried to merge coverage with two different record hashes!"
+            )
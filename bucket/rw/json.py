@@ -2,6 +2,7 @@
 # Copyright (c) 2023-2026 Noodle-Bytes. All Rights Reserved
 
 import json
+import mmap
 from pathlib import Path
 from typing import Iterable, overload
 
@@ -24,6 +25,40 @@ from .common import (
     point_tuple_from_row,
 )
 
+try:
+    # orjson is optional, but much faster than the stdlib for these files
+    import orjson
+except ImportError:
+    orjson = None
+
+# json.dump emits many small chunks, so buffer them into larger writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _load(path: Path) -> dict:
+    if orjson is not None:
+        with path.open("rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped
+                return orjson.loads(f.read())
+            # Parse straight from the mapped file rather than first copying it
+            # into a bytes object
+            with mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump(data: dict, path: Path):
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data))
+    else:
+        with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            json.dump(data, f)
+
+
 ###############################################################################
 # Accessors
 ###############################################################################
@@ -39,8 +74,7 @@ class JSONWriter(Writer):
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
         if self.path.exists():
-            with self.path.open("r") as f:
-                data = json.load(f)
+            data = _load(self.path)
         else:
             data = {}
 
@@ -58,44 +92,41 @@ class JSONWriter(Writer):
         if "records" not in data:
             data["records"] = []
 
-        with self.path.open("w") as f:
-            json.dump(data, f)
+        _dump(data, self.path)
 
     def write(self, readout: Readout):
-        with self.path.open("r") as f:
-            data = json.load(f)
-
-            definition = {
-                "sha": readout.get_def_sha(),
-                "point": [list(it) for it in readout.iter_points()],
-                "axis": [list(it) for it in readout.iter_axes()],
-                "axis_value": [list(it) for it in readout.iter_axis_values()],
-                "goal": [list(it) for it in readout.iter_goals()],
-                "bucket_goal": [list(it) for it in readout.iter_bucket_goals()],
-            }
-
-            definition_id = len(data["definitions"])
-            data["definitions"].append(definition)
-
-            record = {
-                "def": definition_id,
-                "sha": readout.get_rec_sha(),
-                "source": readout.get_source(),
-                "source_key": readout.get_source_key(),
-                "bucket_version": readout.get_bucket_version(),
-                # Always stamp the writer's own format, not the readout's:
-                # it describes how this record is laid out, not where the
-                # data came from.
-                "format_version": JSON_FORMAT_VERSION,
-                "point_hit": [list(it) for it in readout.iter_point_hits()],
-                "bucket_hit": [list(it) for it in readout.iter_bucket_hits()],
-            }
-
-            record_id = len(data["records"])
-            data["records"].append(record)
-
-        with self.path.open("w") as f:
-            json.dump(data, f)
+        data = _load(self.path)
+
+        definition = {
+            "sha": readout.get_def_sha(),
+            "point": [list(it) for it in readout.iter_points()],
+            "axis": [list(it) for it in readout.iter_axes()],
+            "axis_value": [list(it) for it in readout.iter_axis_values()],
+            "goal": [list(it) for it in readout.iter_goals()],
+            "bucket_goal": [list(it) for it in readout.iter_bucket_goals()],
+        }
+
+        definition_id = len(data["definitions"])
+        data["definitions"].append(definition)
+
+        record = {
+            "def": definition_id,
+            "sha": readout.get_rec_sha(),
+            "source": readout.get_source(),
+            "source_key": readout.get_source_key(),
+            "bucket_version": readout.get_bucket_version(),
+            # Always stamp the writer's own format, not the readout's:
+            # it describes how this record is laid out, not where the
+            # data came from.
+            "format_version": JSON_FORMAT_VERSION,
+            "point_hit": [list(it) for it in readout.iter_point_hits()],
+            "bucket_hit": [list(it) for it in readout.iter_bucket_hits()],
+        }
+
+        record_id = len(data["records"])
+        data["records"].append(record)
+
+        _dump(data, self.path)
 
         return record_id
 
@@ -109,13 +140,27 @@ class JSONReader(Reader):
         self.path = Path(path)
 
     def read(self, rec_ref: int):
-        readout = PuppetReadout()
+        data = _load(self.path)
 
-        with self.path.open("r") as f:
-            data = json.load(f)
+        return self._read_record(data, rec_ref, {})
+
+    def read_all(self) -> Iterable[Readout]:
+        """
+        Read all records in the file. The file is only parsed once, and
+        records sharing a definition share its (read-only) definition tables.
+        """
+        data = _load(self.path)
+
+        definitions: dict[int, tuple] = {}
+        for record_index in range(len(data.get("records", []))):
+            yield self._read_record(data, record_index, definitions)
+
+    @staticmethod
+    def _read_record(data: dict, rec_ref: int, definitions: dict[int, tuple]):
+        readout = PuppetReadout()
 
         record = data.get("records", [])[rec_ref]
-        definition = data.get("definitions", [])[record["def"]]
+        def_ref = record["def"]
 
         readout.rec_sha = record["sha"]
         readout.source = record.get("source", "")
@@ -126,28 +171,31 @@ class JSONReader(Reader):
         readout.format_version = check_format_version(
             record.get("format_version"), JSON_FORMAT_VERSION
         )
-        readout.def_sha = definition["sha"]
 
-        readout.points = [point_tuple_from_row(p) for p in definition["point"]]
-        readout.axes = [AxisTuple(*a) for a in definition["axis"]]
-        readout.axis_values = [AxisValueTuple(*av) for av in definition["axis_value"]]
-        readout.goals = [GoalTuple(*g) for g in definition["goal"]]
-        readout.bucket_goals = [
-            BucketGoalTuple(*bg) for bg in definition["bucket_goal"]
-        ]
+        if def_ref not in definitions:
+            definition = data.get("definitions", [])[def_ref]
+            definitions[def_ref] = (
+                definition["sha"],
+                [point_tuple_from_row(p) for p in definition["point"]],
+                [AxisTuple(*a) for a in definition["axis"]],
+                [AxisValueTuple(*av) for av in definition["axis_value"]],
+                [GoalTuple(*g) for g in definition["goal"]],
+                [BucketGoalTuple(*bg) for bg in definition["bucket_goal"]],
+            )
+        (
+            readout.def_sha,
+            readout.points,
+            readout.axes,
+            readout.axis_values,
+            readout.goals,
+            readout.bucket_goals,
+        ) = definitions[def_ref]
 
         readout.point_hits = [PointHitTuple(*ph) for ph in record["point_hit"]]
         readout.bucket_hits = [BucketHitTuple(*bh) for bh in record["bucket_hit"]]
 
         return readout
 
-    def read_all(self) -> Iterable[Readout]:
-        with self.path.open("r") as f:
-            data = json.load(f)
-
-        for record_index in range(len(data.get("records", []))):
-            yield self.read(record_index)
-
 
 class JSONAccessor(Accessor):
     """
@@ -173,13 +221,31 @@ class JSONAccessor(Accessor):
     def merge_files(cls, *json_paths):
         if len(json_paths) == 1 and not isinstance(json_paths[0], (str, Path)):
             json_paths = json_paths[0]
+        # Only the first record is built into a readout, to act as the merge
+        # master. The bucket hits of every record are then added straight from
+        # the parsed file, rather than building a full readout for each.
         merged_readout = None
         for json_path in json_paths:
-            json_accessor = cls(json_path)
-            readout_iter = iter(json_accessor.reader().read_all())
+            data = _load(Path(json_path))
+            if not (records := data.get("records", [])):
+                continue
+
+            checked_record = None
             if merged_readout is None:
-                if (first_readout := next(readout_iter, None)) is None:
-                    continue
-                merged_readout = MergeReadout(first_readout)
-            merged_readout.merge(*readout_iter)
+                first_readout = JSONReader._read_record(data, 0, {})
+                # All records (including the first) are summed below
+                merged_readout = MergeReadout.empty(first_readout)
+                # _read_record has already checked the first record's version
+                checked_record = records[0]
+
+            definitions = data.get("definitions", [])
+            for record in records:
+                if record is not checked_record:
+                    check_format_version(
+                        record.get("format_version"), JSON_FORMAT_VERSION
+                    )
+                merged_readout.merge_bucket_hits(
+                    record["bucket_hit"],
+                    [(definitions[record["def"]]["sha"], record["sha"])],
+                )
         return merged_readout
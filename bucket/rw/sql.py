@@ -2,6 +2,7 @@
 # Copyright (c) 2023-2026 Noodle-Bytes. All Rights Reserved
 
 import logging
+from itertools import islice
 from pathlib import Path
 from typing import Iterable, overload
 
@@ -28,6 +29,10 @@ from .common import (
 
 log = logging.getLogger(__name__)
 
+# Number of rows passed to each executemany when bulk inserting a table
+_BULK_INSERT_BATCH = 10_000
+
+
 ###############################################################################
 # Table definitions
 ###############################################################################
@@ -166,13 +171,17 @@ class SQLWriter(Writer):
                     for column in table.__table__.columns
                     if column.key != ref_column
                 ]
-                rows = []
-                for tup in tuples:
-                    row = {field: getattr(tup, field) for field in fields}
-                    row[ref_column] = ref
-                    rows.append(row)
-                if rows:
-                    session.execute(insert(table), rows)
+                statement = insert(table)
+                # Insert in fixed size batches so the parameter dicts for
+                # very large tables are never all held in memory at once
+                tuples = iter(tuples)
+                while batch := list(islice(tuples, _BULK_INSERT_BATCH)):
+                    rows = []
+                    for tup in batch:
+                        row = {field: getattr(tup, field) for field in fields}
+                        row[ref_column] = ref
+                        rows.append(row)
+                    session.execute(statement, rows)
 
             # Write the definition out
             def_row = DefinitionRow(sha=readout.get_def_sha())
@@ -353,13 +362,42 @@ class SQLAccessor(Accessor):
     def merge_files(cls, *db_paths):
         if len(db_paths) == 1 and not isinstance(db_paths[0], (str, Path)):
             db_paths = db_paths[0]
+        # Only the definition of the first record is read back into python.
+        # Each database is then attached in turn and the bucket hits of all its
+        # runs are summed by SQLite, rather than reading every record out and
+        # merging row by row.
         merged_readout = None
-        for db_path in db_paths:
-            sql_accessor = cls.File(db_path)
-            readout_iter = iter(sql_accessor.read_all())
-            if merged_readout is None:
-                if (first_readout := next(readout_iter, None)) is None:
-                    continue
-                merged_readout = MergeReadout(first_readout)
-            merged_readout.merge(*readout_iter)
+        engine = create_engine("sqlite://")
+        with engine.connect() as connection:
+            for db_path in db_paths:
+                connection.exec_driver_sql("ATTACH DATABASE ? AS src", (str(db_path),))
+                try:
+                    if not connection.exec_driver_sql(
+                        "SELECT 1 FROM src.sqlite_master"
+                        " WHERE type = 'table' AND name = 'run'"
+                    ).all():
+                        continue
+                    runs = connection.exec_driver_sql(
+                        "SELECT run.run, run.sha, definition.sha FROM src.run AS run"
+                        " JOIN src.definition AS definition"
+                        " ON run.definition = definition.definition"
+                        " ORDER BY run.run"
+                    ).all()
+                    if not runs:
+                        continue
+
+                    if merged_readout is None:
+                        first_readout = cls.File(db_path).reader().read(runs[0][0])
+                        # All runs (including the first) are summed below
+                        merged_readout = MergeReadout.empty(first_readout)
+
+                    merged_readout.merge_bucket_hits(
+                        connection.exec_driver_sql(
+                            "SELECT start, SUM(hits) FROM src.bucket_hit GROUP BY start"
+                        ).all(),
+                        [(def_sha, rec_sha) for _run, rec_sha, def_sha in runs],
+                    )
+                finally:
+                    connection.exec_driver_sql("DETACH DATABASE src")
+        engine.dispose()
         return merged_readout
@@ -35,21 +35,21 @@ class MadeUpStuff:
     cat_play_toy = ["Toy_mouse", "Scratching Post", "Laser", "Box"]
 
 
-@dataclass
+@dataclass(slots=True)
 class DogInfo:
     chew_toy: list[str] | None = None
     weight: int | None = None
     leg: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CatInfo:
     evil_thoughts_per_hour: int | None = None
     superiority_factor: str | None = None
     play_toy: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PetInfo:
     pet_type: str | None = None
     breed: str | None = None
@@ -4,6 +4,7 @@
 import logging
 import random
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from bucket import CoverageContext
@@ -21,6 +22,15 @@ from .top import TopPets
 # setup within a testbench, it will demonstrate several useful features.
 
 
+# Choices used by pretend_monitor, looked up once rather than on every sample
+_PET_TYPES = ("Cat", "Dog")
+_DOG_LEGS = (1, 2, 4, 8)
+_PET_NAMES = tuple(MadeUpStuff.pet_names)
+_DOG_CHEW_TOYS = tuple(MadeUpStuff.dog_chew_toys)
+_CAT_SUPERIORITY = tuple(MadeUpStuff.cat_superiority)
+_CAT_PLAY_TOYS = tuple(MadeUpStuff.cat_play_toy)
+
+
 def pretend_monitor(rand):
     """
     Nonsense function to generate a trace object for the example
@@ -31,40 +41,48 @@ def pretend_monitor(rand):
     """
 
     trace = PetInfo()
-    trace.pet_type = rand.choice(["Cat", "Dog"])
+    trace.pet_type = rand.choice(_PET_TYPES)
     trace.breed = rand.randint(0, 4)
     trace.age = rand.randint(0, 18)
-    trace.name = rand.choice(MadeUpStuff.pet_names)
+    trace.name = rand.choice(_PET_NAMES)
 
     if trace.pet_type == "Dog":
         info = DogInfo()
-        info.chew_toy = rand.choices(MadeUpStuff.dog_chew_toys, k=2)
+        info.chew_toy = rand.choices(_DOG_CHEW_TOYS, k=2)
         info.weight = rand.randint(5, 50)
-        info.leg = rand.choice([1, 2, 4, 8])
+        info.leg = rand.choice(_DOG_LEGS)
         trace.info = info
 
     else:
         info = CatInfo()
         info.evil_thoughts_per_hour = rand.randint(5, 50)
-        info.superiority_factor = rand.choice(MadeUpStuff.cat_superiority)
-        info.play_toy = rand.choice(MadeUpStuff.cat_play_toy)
+        info.superiority_factor = rand.choice(_CAT_SUPERIORITY)
+        info.play_toy = rand.choice(_CAT_PLAY_TOYS)
         trace.info = info
     return trace
 
 
-def run_testbench(
-    output_path: Path,
-    rand: random.Random,
+@lru_cache(maxsize=1)
+def get_context_hash() -> str:
+    """
+    Create a context specific hash
+    This is stored alongside recorded coverage and is used to determine if
+    coverage is valid to merge.
+    The repo state doesn't change during a run, so this is only looked up once.
+    """
+    # Note repo path set explicitely here as otherwise it will use the cwd.
+    return subprocess.check_output(
+        ["git", "rev-parse", "HEAD"],
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    ).strip()
+
+
+def build_cvg(
+    pet_info: MadeUpStuff,
     log: logging.Logger,
     apply_filters_and_logging: bool = False,
 ):
-    samples = 250
-
-    # Get some common pet info for coverpoints to use. This would usually come from an ISA
-    # or defined constants. In this case,  it is breeds and names of pets for coverage to use.
-    log.info("Get information used to build coverpoints")
-    pet_info = MadeUpStuff()
-
     # Instance the coverage. We'll be doing this twice in this example, but this is to demonstrate
     # merging as well as other features.
     log.info("Build coverpoints...")
@@ -80,23 +98,20 @@ def run_testbench(
             cvg.exclude_by_name(["group_b", "group_2"])
         else:
             cvg = TopPets()
+    return cvg
 
-    log.info("Run the 'test'...")
-    for _ in range(samples):
-        cvg.sample(pretend_monitor(rand))
-
-    # Create a context specific hash
-    # This is stored alongside recorded coverage and is used to determine if
-    # coverage is valid to merge.
-    # Note repo path set explicitely here as otherwise it will use the cwd.
-    context_hash = subprocess.check_output(
-        ["git", "rev-parse", "HEAD"],
-        cwd=Path(__file__).parent.parent,
-        text=True,
-    ).strip()
 
-    # Create a reader
-    point_reader = PointReader(context_hash)
+def sample_and_export(
+    cvg: TopPets,
+    samples: int,
+    rand: random.Random,
+    point_reader: PointReader,
+    output_path: Path,
+    log: logging.Logger,
+    apply_filters_and_logging: bool = False,
+):
+    log.info("Run the 'test'...")
+    cvg.sample_all(pretend_monitor(rand) for _ in range(samples))
 
     # Read the coverage
     readout = point_reader.read(cvg)
@@ -107,15 +122,16 @@ def run_testbench(
     archive_path = output_path.parent / f"{output_path.stem}{suffix}.bktgz"
     archive_writer = ArchiveAccessor(archive_path).writer()
     archive_writer.write(readout)
-    log.info(f"Coverage exported to archive: {archive_path}")
+    log.info("Coverage exported to archive: %s", archive_path)
 
     # Output to console
     if apply_filters_and_logging:
-        log.info(f"\nThis is the reduced coverage with {samples} samples:")
+        log.info("\nThis is the reduced coverage with %d samples:", samples)
     else:
-        log.info(f"This is the coverage with {samples} samples:")
+        log.info("This is the coverage with %d samples:", samples)
     log.info(
-        f"To view this coverage, open the archive file in the Bucket viewer: {archive_path}"
+        "To view this coverage, open the archive file in the Bucket viewer: %s",
+        archive_path,
     )
     ConsoleWriter().write(readout)
     log.info("-------------------------------------------------------")
@@ -152,11 +168,12 @@ def merge(log, archive_path_1, archive_path_2, merged_archive_path):
     # Export merged coverage to bucket archive format
     archive_writer = ArchiveAccessor(merged_archive_path).writer()
     archive_writer.write(merged_readout)
-    log.info(f"Merged coverage exported to archive: {merged_archive_path}")
+    log.info("Merged coverage exported to archive: %s", merged_archive_path)
 
     log.info("This is the merged coverage from the above 2 regressions.")
     log.info(
-        f"To view this coverage, open the archive file in the Bucket viewer: {merged_archive_path}"
+        "To view this coverage, open the archive file in the Bucket viewer: %s",
+        merged_archive_path,
     )
     log.info("You can use the hosted viewer at: https://noodle-bytes.github.io/bucket/")
     log.info(
@@ -171,14 +188,35 @@ def run(output_dir: Path = Path(".")):
     log = logging.getLogger("tb")
     log.setLevel(logging.DEBUG)
     rand = random.Random()
+    samples = 250
+    output_path = output_dir / "example_regr_file_store"
+
+    # Get some common pet info for coverpoints to use. This would usually come from an ISA
+    # or defined constants. In this case,  it is breeds and names of pets for coverage to use.
+    # This, the context hash and the reader are shared by both runs below.
+    log.info("Get information used to build coverpoints")
+    pet_info = MadeUpStuff()
+
+    # Get the context specific hash used to check coverage is valid to merge
+    context_hash = get_context_hash()
+
+    # Create a reader
+    point_reader = PointReader(context_hash)
 
     # Run "testbench" once with all coverage enabled
-    archive_path_1 = run_testbench(output_dir / "example_regr_file_store", rand, log)
+    cvg = build_cvg(pet_info, log)
+    archive_path_1 = sample_and_export(
+        cvg, samples, rand, point_reader, output_path, log
+    )
 
     # Run "testbench" a second time with some coverage filtered
-    archive_path_2 = run_testbench(
-        output_dir / "example_regr_file_store",
+    cvg_filtered = build_cvg(pet_info, log, apply_filters_and_logging=True)
+    archive_path_2 = sample_and_export(
+        cvg_filtered,
+        samples,
         rand,
+        point_reader,
+        output_path,
         log,
         apply_filters_and_logging=True,
     )
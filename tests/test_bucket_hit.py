@@ -3,7 +3,7 @@
 
 """
 Tests for Bucket.hit(): goal handling (illegal/ignore), axis validation and
-kwarg-based axis setting.
+kwarg-based axis setting, plus the positional Bucket.hit_values().
 """
 
 import logging
@@ -100,3 +100,27 @@ class TestBucketHit:
         cvg = GoalTop()
         with pytest.raises(AxisUnrecognisedValue):
             cvg.sample({"a": 7, "b": 0})
+
+    def test_hit_values_matches_hit(self):
+        cvg = GoalTop()
+        bucket = cvg.cp.bucket
+        bucket.clear()
+        bucket.set_axes(a=1)
+        bucket.hit_values(0, 0)
+        bucket.hit_values(1, 0)
+        # Axis values set beforehand are neither used nor changed
+        assert bucket.axis_values == {"a": 1}
+        bucket.clear()
+        assert cvg.cp._cvg_hits[("0", "0")] == 1
+        assert cvg.cp._cvg_hits[("1", "0")] == 1
+        assert ("0", "1") not in cvg.cp._cvg_hits
+
+    def test_hit_values_checks_goals_and_axis_count(self):
+        cvg = GoalTop(except_on_illegal=True)
+        bucket = cvg.cp.bucket
+        bucket.hit_values(0, 1)
+        assert ("0", "1") not in cvg.cp._cvg_hits
+        with pytest.raises(RuntimeError, match="Illegal bucket"):
+            bucket.hit_values(1, 1)
+        with pytest.raises(AssertionError, match="Incorrect number of axes"):
+            bucket.hit_values(0)
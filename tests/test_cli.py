@@ -103,6 +103,22 @@ class TestCli:
         read_back = next(ArchiveAccessor(archive_out).reader().read_all())
         assert readouts_are_equal(readout_1, read_back)
 
+    def test_write_archive_compresslevel(self, archives, tmp_path):
+        path_1, _, readout_1, _ = archives
+        archive_out = tmp_path / "out.bktgz"
+        result = self.run(
+            "write", "-r", path_1, "archive", "-o", archive_out, "--compress-level", 1
+        )
+        assert result.exit_code == 0
+        read_back = next(ArchiveAccessor(archive_out).reader().read_all())
+        assert readouts_are_equal(readout_1, read_back)
+
+    def test_write_archive_without_readouts(self, tmp_path):
+        archive_out = tmp_path / "out.bktgz"
+        result = self.run("write", "archive", "-o", archive_out)
+        assert result.exit_code == 0
+        assert not archive_out.exists()
+
     def test_write_merge(self, archives, tmp_path):
         path_1, path_2, readout_1, readout_2 = archives
         out = tmp_path / "merged.json"
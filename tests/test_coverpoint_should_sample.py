@@ -110,6 +110,21 @@ class TestCoverpointShouldSample:
         assert cp._cvg_hits[("1",)] == 0
         assert cp._cvg_hits[("2",)] == 1
 
+    def test_sample_all_matches_repeated_sample(self):
+        """sample_all() records the same hits as calling sample() per trace."""
+        traces = [
+            {"value": 0, "sample_me": True},
+            {"value": 1, "sample_me": False},
+            {"value": 2, "sample_me": True},
+            {"value": 2, "sample_me": True},
+        ]
+        cvg = TopWithConditionalSample()
+        for trace in traces:
+            cvg.sample(trace)
+        cvg_all = TopWithConditionalSample()
+        cvg_all.sample_all(iter(traces))
+        assert cvg_all.ConditionalCP._cvg_hits == cvg.ConditionalCP._cvg_hits
+
     def test_should_sample_receives_trace(self):
         """should_sample is called with the same trace object passed to the coverage tree."""
         received_traces = []
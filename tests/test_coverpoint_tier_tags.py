@@ -73,3 +73,52 @@ def test_coverpoint_set_tier_in_setup_is_preserved():
     top = TierTagsTop()
     cp = top.tier_tags_cg.SetupTierCoverpoint
     assert cp._tier == 4
+
+
+class RecordingCoverpoint(Coverpoint):
+    def setup(self, ctx):
+        self.add_axis("value", values=[0, 1], description="Test axis")
+
+    def _sample(self, trace):
+        # Record every visit, even those Coverpoint._sample would skip itself
+        trace.append(self._name)
+        super()._sample(trace)
+
+    def sample(self, trace):
+        pass
+
+
+class RecordingCovergroup(Covergroup):
+    def setup(self, ctx):
+        self.add_coverpoint(RecordingCoverpoint().set_tier(1), name="low")
+        self.add_coverpoint(RecordingCoverpoint().set_tier(3), name="high")
+
+
+class RecordingTop(Covertop):
+    def setup(self, ctx):
+        self.add_covergroup(RecordingCovergroup(), name="group")
+
+
+def test_filtered_coverpoints_are_not_visited_when_sampling():
+    top = RecordingTop()
+
+    def sampled_names():
+        return [child._name for child in top.group._sampled_children()]
+
+    visited = []
+    top.sample(visited)
+    assert sampled_names() == ["high", "low"]
+    assert visited == ["high", "low"]
+
+    top.set_tier_level(2)
+    visited = []
+    top.sample(visited)
+    assert sampled_names() == ["low"]
+    assert visited == ["low"]
+
+    top.set_tier_level(3)
+    top.exclude_by_name("low")
+    visited = []
+    top.sample_all([visited])
+    assert sampled_names() == ["high"]
+    assert visited == ["high"]
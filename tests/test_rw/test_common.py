@@ -3,10 +3,14 @@
 
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from bucket.rw import ArchiveAccessor, JSONAccessor, SQLAccessor
+from bucket.rw import archive as rw_archive
+from bucket.rw import json as rw_json
+from bucket.rw import sql as rw_sql
 from bucket.rw.common import (
     CoverageAccess,
     MergeReadout,
@@ -20,6 +24,29 @@ from ..utils import GeneratedReadout, readouts_are_equal
 
 
 class TestCommon:
+    def test_generated_readout_stream(self):
+        """
+        Pins the values drawn for a seeded generated readout, so a change to
+        how the generator consumes its random streams is noticed
+        """
+        readout = GeneratedReadout(def_seed=3, rec_seed=1)
+        assert len(readout.bucket_goals) == 1903
+        assert [tuple(bg) for bg in readout.bucket_goals[:5]] == [
+            (0, 3),
+            (1, 0),
+            (2, 3),
+            (3, 4),
+            (4, 2),
+        ]
+        assert [tuple(bh) for bh in readout.bucket_hits[:5]] == [
+            (0, 1),
+            (1, 9),
+            (2, 8),
+            (3, 2),
+            (4, 5),
+        ]
+        assert sum(bh.hits for bh in readout.bucket_hits) == 9541
+
     def test_full_readout(self):
         """
         Tests correct results for a uniform generated readout where every
@@ -328,6 +355,17 @@ class TestCommon:
                 SQLAccessor.File(path).writer(), SQLAccessor.File(path).reader()
             )
 
+    def test_roundtrip_sql_batched_inserts(self, monkeypatch):
+        """
+        Tests SQL read/write roundtrip when tables span several insert batches
+        """
+        monkeypatch.setattr(rw_sql, "_BULK_INSERT_BATCH", 3)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "storage.db"
+            self.roundtrip_test(
+                SQLAccessor.File(path).writer(), SQLAccessor.File(path).reader()
+            )
+
     def test_roundtrip_json(self):
         """
         Tests JSON read/write roundtrip
@@ -348,6 +386,65 @@ class TestCommon:
                 ArchiveAccessor(path).writer(), ArchiveAccessor(path).reader()
             )
 
+    @pytest.mark.parametrize(
+        "accessor,suffix,module,attribute,writer_args",
+        [
+            (JSONAccessor, ".json", rw_json, "orjson", ()),
+            # ISA-L is only used for the fast levels
+            (ArchiveAccessor, ".bktgz", rw_archive, "igzip_threaded", (1,)),
+        ],
+    )
+    def test_roundtrip_fallback(
+        self, monkeypatch, accessor, suffix, module, attribute, writer_args
+    ):
+        """
+        Tests read/write roundtrip without an optional fast path, and that files
+        written with and without it read back with the other
+        """
+        if getattr(module, attribute) is None:
+            pytest.skip(f"{attribute} is not installed")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / f"storage{suffix}"
+            readout = GeneratedReadout(def_seed=3, rec_seed=1)
+            fast_ref = accessor(path).writer(*writer_args).write(readout)
+
+            monkeypatch.setattr(module, attribute, None)
+            self.roundtrip_test(accessor(path).writer(), accessor(path).reader())
+            assert readouts_are_equal(readout, accessor(path).reader().read(fast_ref))
+            slow_ref = accessor(path).writer(*writer_args).write(readout)
+
+            monkeypatch.undo()
+            assert readouts_are_equal(readout, accessor(path).reader().read(slow_ref))
+
+    @pytest.mark.parametrize(
+        "compresslevel,uses_isal", [(0, False), (2, True), (9, False)]
+    )
+    def test_archive_compresslevel_isal_range(
+        self, monkeypatch, compresslevel, uses_isal
+    ):
+        """
+        Tests ISA-L only writes archives at levels it can honour (1-3), leaving
+        uncompressed and high levels to zlib
+        """
+        isal = pytest.importorskip("isal.igzip_threaded")
+        opened = []
+
+        def spy_open(*args, **kwargs):
+            opened.append(args)
+            return isal.open(*args, **kwargs)
+
+        monkeypatch.setattr(
+            rw_archive, "igzip_threaded", SimpleNamespace(open=spy_open)
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "storage.bktgz"
+            readout = GeneratedReadout(def_seed=1, rec_seed=1)
+            ref = ArchiveAccessor(path).writer(compresslevel).write(readout)
+            assert bool(opened) == uses_isal
+
+            monkeypatch.undo()
+            assert readouts_are_equal(readout, ArchiveAccessor(path).reader().read(ref))
+
     @pytest.mark.parametrize(
         "accessor_factory,filename",
         [
@@ -425,6 +522,81 @@ class TestCommon:
         # Verify source_key is empty string
         assert merged.get_source_key() == ""
 
+    def test_merge_of_merged_readouts(self):
+        """
+        Merging MergeReadouts together must give the same hits as merging all
+        of their source readouts at once
+        """
+        readouts = [
+            GeneratedReadout(def_seed=1, rec_seed=1, min_hits=seed, max_hits=seed + 2)
+            for seed in range(4)
+        ]
+        merged_a = MergeReadout(readouts[0], readouts[1])
+        merged_b = MergeReadout(readouts[2], readouts[3])
+        merged_a.merge(merged_b)
+
+        expected = MergeReadout(*readouts)
+        assert list(merged_a.iter_bucket_hits()) == list(expected.iter_bucket_hits())
+        assert list(merged_a.iter_point_hits()) == list(expected.iter_point_hits())
+
+    @pytest.mark.parametrize(
+        "start,end,depth", [(0, None, 0), (0, 3, 1), (1, 3, 2), (2, 4, 3), (3, None, 3)]
+    )
+    def test_merge_point_hits_match_bucket_sums(self, start, end, depth):
+        """
+        Merged point hits must match summing each point's merged bucket hits
+        directly, for any range of points
+        """
+        readouts = [
+            GeneratedReadout(def_seed=3, rec_seed=1, min_hits=seed, max_hits=seed + 2)
+            for seed in range(3)
+        ]
+        merged = MergeReadout(*readouts)
+        goal_targets = [goal.target for goal in merged.iter_goals()]
+
+        expected = []
+        for point in merged.iter_points(start, end, depth):
+            hits = hit_buckets = full_buckets = 0
+            for bucket_goal, bucket_hit in zip(
+                merged.iter_bucket_goals(point.bucket_start, point.bucket_end),
+                merged.iter_bucket_hits(point.bucket_start, point.bucket_end),
+                strict=True,
+            ):
+                target = goal_targets[bucket_goal.goal]
+                if target > 0 and bucket_hit.hits > 0:
+                    hits += min(target, bucket_hit.hits)
+                    hit_buckets += 1
+                    full_buckets += bucket_hit.hits >= target
+            expected.append((point.start, point.depth, hits, hit_buckets, full_buckets))
+
+        assert expected
+        assert [
+            tuple(point_hit) for point_hit in merged.iter_point_hits(start, end, depth)
+        ] == expected
+
+    def test_merge_bucket_hits_into_empty_merge(self):
+        """
+        Merging raw bucket hit rows into an empty merge must match merging the
+        readouts themselves, and still check the hashes of each record
+        """
+        readouts = [
+            GeneratedReadout(def_seed=3, rec_seed=1, min_hits=seed, max_hits=seed + 2)
+            for seed in range(3)
+        ]
+        merged = MergeReadout.empty(readouts[0])
+        assert merged.bucket_hits and not any(merged.bucket_hits)
+        for readout in readouts:
+            merged.merge_bucket_hits(
+                [tuple(bh) for bh in readout.iter_bucket_hits()],
+                [(readout.get_def_sha(), readout.get_rec_sha())],
+            )
+
+        expected = MergeReadout(*readouts)
+        assert list(merged.iter_bucket_hits()) == list(expected.iter_bucket_hits())
+
+        with pytest.raises(RuntimeError, match="different record hashes"):
+            merged.merge_bucket_hits([], [(readouts[0].get_def_sha(), "other")])
+
     def test_merge_files_sql(self):
         """
         Tests SQL merge_files functionality
@@ -560,6 +732,28 @@ class TestCommon:
 
             assert merged_hits == original_hits
 
+    def test_merge_files_archive_prefetch(self, monkeypatch):
+        """
+        Tests Archive merge_files with more archives than are unpacked ahead
+        """
+        monkeypatch.setattr(rw_archive, "_MERGE_PREFETCH", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            readouts = [
+                GeneratedReadout(def_seed=1, rec_seed=1, min_hits=i, max_hits=i + 1)
+                for i in range(5)
+            ]
+            paths = []
+            for i, readout in enumerate(readouts):
+                path = Path(tmpdir) / f"file{i}.bktgz"
+                ArchiveAccessor(path).writer().write(readout)
+                paths.append(path)
+
+            merged = ArchiveAccessor.merge_files(paths)
+            assert readouts_are_equal(merged, MergeReadout(*readouts))
+
+            with pytest.raises(FileNotFoundError):
+                ArchiveAccessor.merge_files(*paths, Path(tmpdir) / "missing.bktgz")
+
     def test_merge_files_single_file(self):
         """
         Tests merge_files with a single file (should still work)
@@ -614,6 +808,45 @@ class TestCommon:
             merged_hits = {bh.start: bh.hits for bh in merged.iter_bucket_hits()}
             assert merged_hits == original_hits
 
+    @pytest.mark.parametrize(
+        "accessor,suffix",
+        [
+            (SQLAccessor.File, ".db"),
+            (JSONAccessor, ".json"),
+            (ArchiveAccessor, ".bktgz"),
+        ],
+    )
+    def test_merge_files_matches_python_merge(self, accessor, suffix):
+        """
+        merge_files sums hits straight from the stored rows, which must match
+        merging the readouts in python, and must still reject incompatible
+        records
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path1 = Path(tmpdir) / f"file1{suffix}"
+            path2 = Path(tmpdir) / f"file2{suffix}"
+
+            readouts = [
+                GeneratedReadout(def_seed=3, rec_seed=seed, min_hits=0, max_hits=5)
+                for seed in (1, 2, 3)
+            ]
+            for readout in readouts:
+                readout.rec_sha = readouts[0].rec_sha
+            accessor(path1).writer().write(readouts[0])
+            accessor(path1).writer().write(readouts[1])
+            accessor(path2).writer().write(readouts[2])
+
+            merged = accessor(path1).merge_files(path1, path2)
+            expected = MergeReadout(*readouts)
+            assert list(expected.iter_bucket_hits())
+            assert list(merged.iter_bucket_hits()) == list(expected.iter_bucket_hits())
+            assert list(merged.iter_point_hits()) == list(expected.iter_point_hits())
+
+            path3 = Path(tmpdir) / f"file3{suffix}"
+            accessor(path3).writer().write(GeneratedReadout(def_seed=2))
+            with pytest.raises(RuntimeError):
+                accessor(path3).merge_files(path1, path3)
+
     def test_merge_files_empty_json(self):
         """
         Tests merge_files with empty JSON file (should skip it)
@@ -779,6 +1012,36 @@ class TestCommon:
                 assert len(points) == len(list(original.iter_points()))
                 assert readouts_are_equal(original, from_file)
 
+    def test_archive_write_all_matches_repeated_writes(self):
+        """
+        Writing several readouts in one batch must produce the same records
+        (and record references) as writing them one at a time.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            readouts = [GeneratedReadout(def_seed=s, rec_seed=s) for s in (1, 2, 3)]
+
+            single_path = Path(tmpdir) / "single.bktgz"
+            single_writer = ArchiveAccessor(single_path).writer()
+            single_refs = [single_writer.write(readout) for readout in readouts]
+
+            batch_path = Path(tmpdir) / "batch.bktgz"
+            batch_refs = ArchiveAccessor(batch_path).writer().write_all(readouts)
+            assert batch_refs == single_refs
+
+            read_back = list(ArchiveAccessor(batch_path).reader().read_all())
+            assert len(read_back) == len(readouts)
+            for original, from_file in zip(readouts, read_back, strict=True):
+                assert readouts_are_equal(original, from_file)
+
+    def test_archive_write_all_empty(self):
+        """
+        Writing no readouts must not create (or repack) the archive.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "storage.bktgz"
+            assert ArchiveAccessor(path).writer().write_all(iter([])) == []
+            assert not path.exists()
+
     def test_sql_write_minimal_readout(self):
         """
         Readouts with few/no rows in some tables must still write to SQL
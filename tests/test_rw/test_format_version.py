@@ -253,3 +253,34 @@ class TestJSONFormatVersion:
             with pytest.warns(UserWarning, match="storage format"):
                 readout = JSONAccessor(path).read(0)
             assert readout.get_format_version() == JSON_FORMAT_VERSION + 1
+
+    def test_merge_files_warns_for_newer_later_file(self):
+        """Merging checks the format of every record, not just the first."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = _write_json(Path(tmpdir))
+            second = _write_json(Path(tmpdir) / "second")
+
+            def bump_format(record):
+                record["format_version"] = JSON_FORMAT_VERSION + 1
+                return record
+
+            _rewrite_json_records(second, bump_format)
+
+            with pytest.warns(UserWarning, match="storage format"):
+                JSONAccessor.merge_files(first, second)
+
+    def test_merge_files_warns_once_for_newer_first_record(self):
+        """The first record is only version checked once while merging."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = _write_json(Path(tmpdir))
+            second = _write_json(Path(tmpdir) / "second")
+
+            def bump_format(record):
+                record["format_version"] = JSON_FORMAT_VERSION + 1
+                return record
+
+            _rewrite_json_records(first, bump_format)
+
+            with pytest.warns(UserWarning, match="storage format") as record:
+                JSONAccessor.merge_files(first, second)
+            assert len(record) == 1
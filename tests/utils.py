@@ -150,11 +150,17 @@ class GeneratedReadout(PuppetReadout):
             per_axis_value_start = axis_value_end
 
         bucket_end = bucket_start + reduce(mul, axis_sizes, 1)
-        for bucket_offset in range(bucket_start, bucket_end):
-            goal_idx = self.def_random.randint(goal_start, goal_end - 1)
-
+        # Draw the goals and hits for all the buckets at once, rather than
+        # making a call into the generator per bucket
+        bucket_count = bucket_end - bucket_start
+        goal_idxs = self.def_random.choices(range(goal_start, goal_end), k=bucket_count)
+        all_bucket_hits = self.rec_random.choices(
+            range(self._min_hits, self._max_hits + 1), k=bucket_count
+        )
+        for bucket_offset, goal_idx, bucket_hits in zip(
+            range(bucket_start, bucket_end), goal_idxs, all_bucket_hits
+        ):
             bucket_target = self.goals[goal_idx].target
-            bucket_hits = self.rec_random.randint(self._min_hits, self._max_hits)
 
             if bucket_target > 0:
                 target += bucket_target
@@ -19,6 +19,7 @@ import argparse
 import logging
 import random
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from bucket import CoverageContext
@@ -28,6 +29,7 @@ from example.example import pretend_monitor
 from example.top import TopPets
 
 
+@lru_cache(maxsize=1)
 def get_context_hash(repo_root: Path) -> str:
     return subprocess.check_output(
         ["git", "rev-parse", "HEAD"],
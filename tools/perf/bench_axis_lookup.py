@@ -38,17 +38,29 @@ def main() -> int:
         default=1_000_000,
         help="Number of lookup calls per benchmark",
     )
+    parser.add_argument(
+        "--case",
+        choices=["all", "exact", "ranges"],
+        default="all",
+        help="Only run the named benchmark",
+    )
     args = parser.parse_args()
 
-    exact_secs = benchmark_exact(args.iterations)
-    range_secs = benchmark_ranges(args.iterations)
+    exact_secs = None
+    range_secs = None
+    if args.case in ("all", "exact"):
+        exact_secs = benchmark_exact(args.iterations)
+    if args.case in ("all", "ranges"):
+        range_secs = benchmark_ranges(args.iterations)
 
     print("Axis lookup benchmark")
     print(f"iterations: {args.iterations}")
-    print(f"exact values: {exact_secs:.6f} s")
-    print(f"range values: {range_secs:.6f} s")
+    if exact_secs is not None:
+        print(f"exact values: {exact_secs:.6f} s")
+    if range_secs is not None:
+        print(f"range values: {range_secs:.6f} s")
 
-    if exact_secs > 0:
+    if exact_secs and range_secs is not None:
         print(f"range/exact ratio: {range_secs / exact_secs:.2f}x")
 
     return 0
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2023-2026 Noodle-Bytes. All Rights Reserved
+"""
+Benchmark sampling the example coverage in one process against splitting the
+samples across worker processes and merging the partial readouts.
+
+Sampling is pure python and holds the GIL, so processes are used rather than
+threads. Each worker builds its own copy of the coverage and samples it with its
+own seeded Random; the readouts are merged as each shard finishes.
+
+Usage (from repo root, with bucket installed):
+
+    python tools/perf/bench_sharded_sampling.py
+    python tools/perf/bench_sharded_sampling.py --samples 200000 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from time import perf_counter
+
+# Import the example from the tree this script lives in
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from bucket.rw import MergeReadout, PointReader  # noqa: E402
+from example.common import MadeUpStuff  # noqa: E402
+from example.example import build_cvg, pretend_monitor  # noqa: E402
+
+log = logging.getLogger("bench")
+
+# The example deliberately hits illegal buckets, which would otherwise log an
+# error per hit and swamp the timings. Set at import so spawned workers get it too.
+logging.disable(logging.ERROR)
+
+
+def _sample_shard(
+    pet_info: MadeUpStuff, samples: int, seed: int, point_reader: PointReader
+):
+    """
+    Build and sample a full copy of the coverage in a worker process
+    """
+    rand = random.Random(seed)
+    cvg = build_cvg(pet_info, log)
+    cvg.sample_all(pretend_monitor(rand) for _ in range(samples))
+    return point_reader.read(cvg)
+
+
+def benchmark_single(pet_info: MadeUpStuff, samples: int, seed: int) -> float:
+    point_reader = PointReader("")
+
+    start = perf_counter()
+    _sample_shard(pet_info, samples, seed, point_reader)
+    return perf_counter() - start
+
+
+def benchmark_sharded(
+    pet_info: MadeUpStuff, samples: int, seed: int, workers: int
+) -> float:
+    point_reader = PointReader("")
+    rand = random.Random(seed)
+    shard_sizes = [
+        samples // workers + (1 if shard < samples % workers else 0)
+        for shard in range(workers)
+    ]
+    seeds = [rand.getrandbits(64) for _ in range(workers)]
+
+    start = perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        readouts = executor.map(
+            _sample_shard, repeat(pet_info), shard_sizes, seeds, repeat(point_reader)
+        )
+        merged_readout = MergeReadout(next(readouts))
+        # Merge each shard as soon as it is ready, so only one is held at a time
+        for readout in readouts:
+            merged_readout.merge(readout)
+    return perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark single-process against sharded example sampling"
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=50_000,
+        help="Total number of samples per benchmark",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes for the sharded benchmark",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    pet_info = MadeUpStuff()
+    single_secs = benchmark_single(pet_info, args.samples, args.seed)
+    sharded_secs = benchmark_sharded(pet_info, args.samples, args.seed, args.workers)
+
+    print("Example sampling benchmark")
+    print(f"samples: {args.samples}")
+    print(f"single process: {single_secs:.6f} s")
+    print(f"{args.workers} workers: {sharded_secs:.6f} s")
+    print(f"speedup: {single_secs / sharded_secs:.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())